@@ -9,7 +9,11 @@ from typing import (
     Coroutine,
     TYPE_CHECKING
 )
-from copy import copy
+from collections.abc import Mapping
+from functools import wraps
+from operator import attrgetter
+from types import MethodType
+from weakref import WeakKeyDictionary
 import inspect
 
 T = TypeVar('T')
@@ -19,15 +23,27 @@ MaybeCoroutineFunc = Callable[[T], Union[T, Coroutine[Any, Any, T]]]
 
 
 class _MissingSentinel:
-    """A sentinel object to represent a missing value."""
+    """A sentinel object to represent a missing value.
+
+    There is only ever one instance, so compare with ``x is MISSING``.
+    """
 
     __slots__ = ()
 
+    _instance: Optional['_MissingSentinel'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def __bool__(self):
         return False
 
-    def __eq__(self, other):
-        return False
+    __hash__ = object.__hash__
+
+    def __reduce__(self):
+        return (_MissingSentinel, ())
 
     def __repr__(self):
         return '...'
@@ -35,6 +51,25 @@ class _MissingSentinel:
 
 MISSING: Any = _MissingSentinel()
 
+_is_coro_cache: WeakKeyDictionary[Callable, bool] = WeakKeyDictionary()
+
+
+def _is_coroutine_function(func: Callable) -> bool:
+    if isinstance(func, MethodType):
+        # bound methods are created anew on each attribute access
+        func = func.__func__
+
+    try:
+        flag = _is_coro_cache.get(func)
+    except TypeError:
+        # not weak-referenceable (or unhashable), so it cannot be cached
+        return inspect.iscoroutinefunction(func)
+
+    if flag is None:
+        flag = _is_coro_cache[func] = inspect.iscoroutinefunction(func)
+
+    return flag
+
 
 def find(predicate: Callable[[T], bool], iterable: Iterable[T]) -> Optional[T]:
     """A helper to return the first element found in the sequence
@@ -46,23 +81,33 @@ def find(predicate: Callable[[T], bool], iterable: Iterable[T]) -> Optional[T]:
         The predicate to check against.
     iterable : Iterable[T]
         The iterable to search through.
+
+    This is a linear scan. When looking items up repeatedly by the same
+    attribute (e.g. ``lambda x: x.id == k``), build a dict once instead:
+
+    >>> by_id = {x.id: x for x in iterable}
+    >>> item = by_id.get(k)
     """
 
-    for i in iterable:
-        if predicate(i):
-            return i
-    return None
+    return next(filter(predicate, iterable), None)
 
 
-def get(iterable: Iterable[T], conditions: dict[str, Any]) -> Optional[T]:
+def get(
+    iterable: Iterable[T],
+    conditions: Union[Mapping[str, Any], Iterable[tuple[str, Any]]],
+    key_order: Optional[Callable[[str], Any]] = None
+) -> Optional[T]:
     """A helper to return the first element found in the iterable
 
     Parameters
     ----------
     iterable : Iterable[T]
         The iterable to search through.
-    conditions : dict[str, Any]
-        The conditions to check against.
+    conditions : Union[Mapping[str, Any], Iterable[tuple[str, Any]]]
+        The conditions to check against, as a mapping or ``(key, value)`` pairs.
+    key_order : Optional[Callable[[str], Any]], optional
+        A sort key applied to the condition keys to decide the order they
+        are checked in, by default None (the given order is kept)
 
     Returns
     -------
@@ -72,6 +117,9 @@ def get(iterable: Iterable[T], conditions: dict[str, Any]) -> Optional[T]:
     To have a nested attribute search (i.e. search by ``x.y``) then
     pass in ``x.y`` as the conditions' dict key.
 
+    The check stops at the first mismatch, so put the most selective
+    keys first, or pass e.g. ``key_order=lambda k: k.count('.')`` to
+    test shallow attribute chains before deep ones.
 
     Sample
     ------
@@ -90,21 +138,122 @@ def get(iterable: Iterable[T], conditions: dict[str, Any]) -> Optional[T]:
     >>> var_2 = get([A(B(1, 2), 3), A(B(4, 5), 6)], {'a.c': 4, 'b': 6})  # returns A(B(4, 5), 6)
     """
 
+    if isinstance(conditions, Mapping):
+        conditions = conditions.items()
+    if key_order is not None:
+        conditions = sorted(conditions, key=lambda c: key_order(c[0]))
+
+    getters = [(attrgetter(k), v) for k, v in conditions]
+
     for item in iterable:
-        flags: list[bool] = []
+        for getter, v in getters:
+            if getter(item) != v:
+                break
+        else:
+            return item
 
-        for k, v in conditions.items():
-            var = copy(item)
+    return None
 
-            for attr in k.split('.'):
-                var = getattr(var, attr)
 
-            flags.append(var==v)
+class GetIndex:
+    """A reusable index to run many :func:`get` queries against the same items.
 
-        if all(flags):
-            return item
+    The attributes named by ``keys`` are read once on construction and
+    grouped by value, so each query only looks at items whose values
+    already match. The indexed values must be hashable.
 
-    return None
+    Parameters
+    ----------
+    items : Iterable[T]
+        The items to index.
+    keys : Iterable[str]
+        The (possibly dotted) attribute names to index.
+
+    Sample
+    ------
+    >>> index = GetIndex([A(B(1, 2), 3), A(B(4, 5), 6)], ['a.c', 'b'])
+    >>> var = index.get({'a.c': 4, 'b': 6})  # returns A(B(4, 5), 6)
+    """
+
+    __slots__ = (
+        '_items',
+        '_columns',
+        '_positions'
+    )
+
+    if TYPE_CHECKING:
+        _items: list[T]
+        _columns: dict[str, list[Any]]
+        _positions: dict[str, dict[Any, list[int]]]
+
+    def __init__(self, items: Iterable[T], keys: Iterable[str]) -> None:
+        self._items = list(items)
+        self._columns = {}
+        self._positions = {}
+
+        for k in keys:
+            column = list(map(attrgetter(k), self._items))
+            positions: dict[Any, list[int]] = {}
+
+            for i, value in enumerate(column):
+                positions.setdefault(value, []).append(i)
+
+            self._columns[k] = column
+            self._positions[k] = positions
+
+    def get(
+        self,
+        conditions: Union[Mapping[str, Any], Iterable[tuple[str, Any]]]
+    ) -> Optional[T]:
+        """Return the first indexed item that meets the conditions.
+
+        Falls back to :func:`get` when a condition key was not indexed
+        or a condition value is unhashable.
+
+        Parameters
+        ----------
+        conditions : Union[Mapping[str, Any], Iterable[tuple[str, Any]]]
+            The conditions to check against, as a mapping or ``(key, value)`` pairs.
+
+        Returns
+        -------
+        Optional[T]
+            The first item that meets the conditions.
+        """
+
+        if isinstance(conditions, Mapping):
+            conditions = conditions.items()
+        conditions = list(conditions)
+
+        if not conditions:
+            return self._items[0] if self._items else None
+
+        if not all(k in self._positions for k, _ in conditions):
+            return get(self._items, conditions)
+
+        candidates: Optional[list[int]] = None
+
+        for k, v in conditions:
+            try:
+                positions = self._positions[k].get(v)
+            except TypeError:
+                return get(self._items, conditions)
+
+            if positions is None:
+                return None
+            if candidates is None or len(positions) < len(candidates):
+                candidates = positions
+
+        checks = [(self._columns[k], v) for k, v in conditions]
+
+        for i in candidates:
+            for column, v in checks:
+                if column[i] != v:
+                    break
+            else:
+                return self._items[i]
+
+        return None
 
 
 async def maybe_coroutine(
@@ -123,40 +272,92 @@ async def maybe_coroutine(
     -------
     Coroutine[Any, Any, T]
         The result of the function or coroutine.
+
+    On hot paths where ``func`` is usually synchronous, calling it
+    directly avoids creating this coroutine:
+
+    >>> res = func(1, 2)
+    >>> if inspect.isawaitable(res):
+    >>>     res = await res
+
+    Unlike this helper, that pattern also awaits an awaitable returned
+    by a plain (non-``async``) function.
     """
 
-    if inspect.iscoroutinefunction(func):
+    if _is_coroutine_function(func):
         return await func(*args, **kwargs)
     else:
         return func(*args, **kwargs)
 
 
+def as_maybe_coroutine(func: MaybeCoroutineFunc) -> CoroutineFunc:
+    """A decorator to turn a function or coroutine function into
+    a coroutine function.
+
+    The check is done once here instead of on every call, so the
+    result can simply be awaited.
+
+    Parameters
+    ----------
+    func : Callable[[T], Union[T, Coroutine[Any, Any, T]]]
+        The function or coroutine function to convert.
+
+    Returns
+    -------
+    Callable[..., Coroutine[Any, Any, T]]
+        ``func`` itself if it is already a coroutine function,
+        otherwise an async wrapper around it.
+
+    Sample
+    ------
+    >>> @as_maybe_coroutine
+    >>> def callback(x):
+    >>>     return x
+    >>>
+    >>> res = await callback(1)  # 1
+    """
+
+    if _is_coroutine_function(func):
+        return func
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
 class Content:
     """This class represents the content of a documentation."""
 
     __slots__ = (
-        '__description',
-        'extra'
+        '_cache',
     )
 
 
     if TYPE_CHECKING:
-        __description: str
-        extra: Any
+        _cache: dict[str, Any]
 
-    def __init__(self, **kwargs):
-        self.__description = kwargs.get('description')
-        self.extra = kwargs.get('extra')
+    def __init__(self, description: Optional[str] = None, extra: Any = None):
+        self._cache = {
+            "description": description,
+            "extra": extra,
+        }
 
     def to_dict(self) -> dict[str, Any]:
-        return {
-            "description": self.description,
-            "extra": self.extra,
-        }
+        return dict(self._cache)
 
     @property
     def description(self) -> Optional[str]:
-        return self.__description
+        return self._cache["description"]
+
+    @property
+    def extra(self) -> Any:
+        return self._cache["extra"]
+
+    @extra.setter
+    def extra(self, value: Any) -> None:
+        self._cache["extra"] = value
 
 
 
@@ -164,24 +365,24 @@ class Docs:
     """This class represents the documentation of functions."""
 
     __slots__ = (
-        '__data'
+        '_data',
     )
 
     if TYPE_CHECKING:
-        __data: dict[str, Content]
+        _data: dict[str, Content]
 
     def __init__(self) -> None:
-        self.__data = {}
+        self._data = {}
 
     @property
     def data(self) -> dict[str, Content]:
-        return self.__data
+        return self._data
 
     def to_dict(self) -> dict[str, dict[str, Any]]:
-        return {k: v.to_dict() for k, v in self.__data.items()}
+        return {k: v._cache.copy() for k, v in self._data.items()}
 
     def __str__(self) -> str:
-        return str(self.to_dict())
+        return str({k: v._cache for k, v in self._data.items()})
 
 
     def register_doc(self, extra: Optional[Any] = None) -> Func_T:
@@ -210,14 +411,11 @@ class Docs:
         '''
 
         def decorator(func: Func_T):
-            self.__data[func.__qualname__] = Content(
+            self._data[func.__qualname__] = Content(
                 description=func.__doc__,
                 extra=extra
             )
-            def wrapper(*args, **kwargs):
-                return func(*args, **kwargs)
-
-            return wrapper
+            return func
 
         return decorator
 
@@ -270,14 +468,22 @@ class ErrorHandler:
 
         def decorator(func: Func_T):
 
+            if ignore_exception:
+                def wrapper(*args, **kwargs):
+                    try:
+                        return func(*args, **kwargs)
+                    except Exception:
+                        return
+
+                return wrapper
+
+            on_error = cls.on_error
+
             def wrapper(*args, **kwargs):
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
-                    if ignore_exception:
-                        return
-                    else:
-                        cls.on_error(e, func, *args, **kwargs)
+                    on_error(e, func, *args, **kwargs)
 
             return wrapper
 